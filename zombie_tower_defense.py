@@ -4,8 +4,9 @@ Zombie Survival Tower Defense (Single-file Pygame)
 Installation
 ------------
 1) Install Python 3.10+ from https://www.python.org/
-2) Install Pygame:
-   - Windows/macOS/Linux:  python -m pip install pygame
+2) Install Pygame and NumPy:
+   - Windows/macOS/Linux:  python -m pip install pygame numpy
+   - Optional, for JIT-compiled hot loops:  python -m pip install numba
 3) Run the game:
    - python zombie_tower_defense.py
 
@@ -17,18 +18,34 @@ score saving.
 import json
 import math
 import os
-import random
 import sys
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
+import numpy as np
 import pygame
 
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Fallback when numba is missing: kernels run as plain Python."""
+        def decorate(func):
+            return func
+        return decorate
+
 # ----------------------------
 # Config
 # ----------------------------
 WIDTH, HEIGHT = 1100, 720
 FPS = 60
+# Simulation runs on a fixed tick; rendering interpolates between ticks.
+SIM_DT = 1 / 30
+MAX_FRAME_TIME = 0.25
 TITLE = "Zombie Survival: Tower Defense"
 HIGHSCORE_FILE = "highscore.json"
 
@@ -50,12 +67,46 @@ GRID_SIZE = 50
 UI_HEIGHT = 100
 PLAY_AREA = pygame.Rect(0, 0, WIDTH, HEIGHT - UI_HEIGHT)
 
+# Towers must keep this far from the path centreline. The distance field is
+# sampled at cell centres, so a lookup is only trusted outside SLACK of the edge.
+PATH_CLEARANCE = 40
+PATH_SDF_CELL = 8
+PATH_SDF_SLACK = math.ceil(PATH_SDF_CELL * math.sqrt(2) / 2) + 1
+
+# Bucket size for the targeting grid, about half the longest tower range.
+TARGET_GRID_CELL = 64
+
+PROJECTILE_SPEED = 320
+PROJECTILE_RADIUS = 4
+
 # ----------------------------
 # Helpers
 # ----------------------------
 
-def clamp(value, low, high):
-    return max(low, min(high, value))
+_TEXT_CACHE = {}
+
+
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render antialiased text once per (font, text, color) and reuse the surface."""
+    key = (font, text, color)
+    surface = _TEXT_CACHE.get(key)
+    if surface is None:
+        surface = _TEXT_CACHE[key] = font.render(text, True, color)
+    return surface
+
+
+_RANGE_SURFS = {}
+
+
+def blit_range_circle(surface: pygame.Surface, center, radius: int, color: Tuple[int, int, int]):
+    """Blit a cached 1 px range outline instead of rasterizing it every frame."""
+    key = (radius, color)
+    ring = _RANGE_SURFS.get(key)
+    if ring is None:
+        ring = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(ring, color, (radius, radius), radius, 1)
+        ring = _RANGE_SURFS[key] = ring.convert_alpha()
+    surface.blit(ring, (center[0] - radius, center[1] - radius))
 
 
 def load_high_score() -> int:
@@ -78,15 +129,180 @@ def save_high_score(score: int):
 
 
 def smoothstep(t: float) -> float:
-    t = clamp(t, 0.0, 1.0)
+    if t < 0.0:
+        t = 0.0
+    elif t > 1.0:
+        t = 1.0
     return t * t * (3 - 2 * t)
 
 
+@njit(cache=True, fastmath=True)
+def find_targets(tower_xy, tower_range2, zombie_xy, alive):
+    """Return the slot of the closest live zombie in range of each tower, or -1.
+
+    Zombies are bucketed into a uniform TARGET_GRID_CELL grid (a counting
+    sort, so buckets are contiguous runs of one slot array). Each tower
+    then scans only the buckets overlapping its range square. Ties go to
+    the lowest slot, as with a plain linear scan.
+    """
+    n_towers = tower_xy.shape[0]
+    n_zombies = zombie_xy.shape[0]
+    targets = np.full(n_towers, -1, dtype=np.int32)
+    if n_towers == 0 or n_zombies == 0:
+        return targets
+
+    cell = TARGET_GRID_CELL
+    min_x = zombie_xy[:, 0].min()
+    min_y = zombie_xy[:, 1].min()
+    cols = int((zombie_xy[:, 0].max() - min_x) // cell) + 1
+    rows = int((zombie_xy[:, 1].max() - min_y) // cell) + 1
+    cell_of = np.empty(n_zombies, dtype=np.int64)
+    starts = np.zeros(cols * rows + 1, dtype=np.int64)
+    for z in range(n_zombies):
+        c = int((zombie_xy[z, 1] - min_y) // cell) * cols + int((zombie_xy[z, 0] - min_x) // cell)
+        cell_of[z] = c
+        starts[c + 1] += 1
+    for c in range(cols * rows):
+        starts[c + 1] += starts[c]
+    fill = starts[:-1].copy()
+    slots = np.empty(n_zombies, dtype=np.int64)
+    for z in range(n_zombies):
+        slots[fill[cell_of[z]]] = z
+        fill[cell_of[z]] += 1
+
+    for t in range(n_towers):
+        tx = tower_xy[t, 0]
+        ty = tower_xy[t, 1]
+        reach = np.sqrt(tower_range2[t])
+        col_lo = max(int((tx - reach - min_x) // cell), 0)
+        col_hi = min(int((tx + reach - min_x) // cell), cols - 1)
+        row_lo = max(int((ty - reach - min_y) // cell), 0)
+        row_hi = min(int((ty + reach - min_y) // cell), rows - 1)
+        # Start from the range itself rather than inf: fastmath lets the compiler
+        # assume no infinities, so an inf sentinel would not be safe to compare.
+        best = tower_range2[t]
+        for row in range(row_lo, row_hi + 1):
+            for col in range(col_lo, col_hi + 1):
+                c = row * cols + col
+                for k in range(starts[c], starts[c + 1]):
+                    z = slots[k]
+                    if not alive[z]:
+                        continue
+                    dx = zombie_xy[z, 0] - tx
+                    dy = zombie_xy[z, 1] - ty
+                    d2 = dx * dx + dy * dy
+                    if d2 < best or (d2 == best and (targets[t] < 0 or z < targets[t])):
+                        best = d2
+                        targets[t] = z
+    return targets
+
+
+def find_targets_broadcast(tower_xy, tower_range2, zombie_xy, alive):
+    """NumPy version of find_targets built on one (towers, zombies) distance matrix."""
+    targets = np.full(len(tower_xy), -1, dtype=np.int32)
+    if not len(tower_xy) or not len(zombie_xy):
+        return targets
+    dx = tower_xy[:, None, 0] - zombie_xy[None, :, 0]
+    dy = tower_xy[:, None, 1] - zombie_xy[None, :, 1]
+    d2 = dx * dx + dy * dy
+    d2[(d2 > tower_range2[:, None]) | ~alive[None, :]] = np.inf
+    nearest = d2.argmin(axis=1)
+    in_range = np.isfinite(d2[np.arange(len(tower_xy)), nearest])
+    targets[in_range] = nearest[in_range]
+    return targets
+
+
+# Without numba the loop kernel would run as interpreted Python, where a
+# single broadcast distance matrix is much cheaper.
+if not HAVE_NUMBA:
+    find_targets = find_targets_broadcast
+
+
+@njit(cache=True, fastmath=True)
+def advance_swarm(pos, speed, slow_timer, slow_factor, path_index, path_s, alive,
+                  seg_start, seg_dir, seg_len, dt):
+    """Advance every zombie along the path in one pass; return how many escaped.
+
+    Each zombie is tracked by its segment and arc length ``path_s`` along it;
+    ``pos`` is recovered from the precomputed segment start and direction.
+    Arrays are updated in place. Zombies that reach the last waypoint are
+    marked not alive, for the caller to remove.
+    """
+    last = seg_len.shape[0]
+    escaped = 0
+    for z in range(pos.shape[0]):
+        if slow_timer[z] > 0:
+            slow_timer[z] -= dt
+        else:
+            slow_factor[z] = 1.0
+        seg = path_index[z]
+        s = path_s[z] + speed[z] * slow_factor[z] * dt
+        while seg < last and s >= seg_len[seg]:
+            s -= seg_len[seg]
+            seg += 1
+        if seg >= last:
+            seg = last - 1
+            s = seg_len[seg]
+            if alive[z]:
+                alive[z] = False
+                escaped += 1
+        path_index[z] = seg
+        path_s[z] = s
+        pos[z, 0] = seg_start[seg, 0] + seg_dir[seg, 0] * s
+        pos[z, 1] = seg_start[seg, 1] + seg_dir[seg, 1] * s
+    return escaped
+
+
+@njit(cache=True, fastmath=True)
+def point_segment_dist2(px, py, ax, ay, bx, by):
+    """Squared distance from (px, py) to the segment a-b."""
+    abx = bx - ax
+    aby = by - ay
+    apx = px - ax
+    apy = py - ay
+    ab_len2 = abx * abx + aby * aby
+    if ab_len2 == 0:
+        return apx * apx + apy * apy
+    t = min(max((apx * abx + apy * aby) / ab_len2, 0.0), 1.0)
+    dx = apx - abx * t
+    dy = apy - aby * t
+    return dx * dx + dy * dy
+
+
+@njit(cache=True, fastmath=True)
+def min_dist2_to_path(px, py, path_xy):
+    """Squared distance from (px, py) to the nearest segment of the path polyline.
+
+    The path must have at least one segment. The first segment seeds the
+    minimum because fastmath assumes no infinities, so inf is not a safe start.
+    """
+    best = point_segment_dist2(px, py, path_xy[0, 0], path_xy[0, 1], path_xy[1, 0], path_xy[1, 1])
+    for i in range(1, path_xy.shape[0] - 1):
+        d2 = point_segment_dist2(px, py, path_xy[i, 0], path_xy[i, 1], path_xy[i + 1, 0], path_xy[i + 1, 1])
+        if d2 < best:
+            best = d2
+    return best
+
+
+def warm_up_kernels():
+    """Compile (or load from numba's cache) every kernel before gameplay needs it."""
+    xy = np.zeros((2, 2), dtype=np.float32)
+    values = np.zeros(2, dtype=np.float32)
+    find_targets(xy, values, xy, np.zeros(2, dtype=bool))
+    advance_swarm(xy.copy(), values, values.copy(), values.copy(), np.zeros(2, dtype=np.int32),
+                  values.copy(), np.zeros(2, dtype=bool), xy, xy, values + 1, 0.0)
+    min_dist2_to_path(0.0, 0.0, xy)
+
+
+if HAVE_NUMBA:
+    warm_up_kernels()
+
+
 # ----------------------------
 # Data definitions
 # ----------------------------
 
-@dataclass
+@dataclass(frozen=True)
 class TowerType:
     name: str
     cost: int
@@ -107,157 +323,345 @@ TOWER_TYPES = [
     TowerType("Frost", 120, 150, 1.2, 12, TEAL, TEAL, slow=0.45, slow_duration=1.8),
 ]
 
+# Shop cards in the UI strip, one per entry in TOWER_TYPES.
+UI_RECT = pygame.Rect(0, PLAY_AREA.bottom, WIDTH, UI_HEIGHT)
+TOWER_CARD_RECTS = [pygame.Rect(420 + i * 160, PLAY_AREA.bottom + 10, 140, 70) for i in range(len(TOWER_TYPES))]
+
 ZOMBIE_TYPES = {
-    "walker": {"speed": 45, "health": 90, "reward": 8, "color": (90, 200, 120)},
-    "runner": {"speed": 80, "health": 65, "reward": 10, "color": (110, 230, 150)},
-    "brute": {"speed": 35, "health": 200, "reward": 18, "color": (70, 170, 80)},
-    "boss": {"speed": 30, "health": 800, "reward": 80, "color": (150, 240, 150)},
+    "walker": {"speed": 45, "health": 90, "reward": 8, "color": (90, 200, 120), "radius": 16, "spawn_delay": 0.8},
+    "runner": {"speed": 80, "health": 65, "reward": 10, "color": (110, 230, 150), "radius": 16, "spawn_delay": 0.7},
+    "brute": {"speed": 35, "health": 200, "reward": 18, "color": (70, 170, 80), "radius": 16, "spawn_delay": 1.4},
+    "boss": {"speed": 30, "health": 800, "reward": 80, "color": (150, 240, 150), "radius": 24, "spawn_delay": 2.2},
 }
+ZOMBIE_TYPE_NAMES = list(ZOMBIE_TYPES)
+WALKER, RUNNER, BRUTE, BOSS = range(len(ZOMBIE_TYPE_NAMES))
+
+
+# ----------------------------
+# Sprites
+# ----------------------------
+
+# Indexed by ZombieSwarm.type_id and ProjectilePool.kind (a TOWER_TYPES index)
+# respectively; filled by build_sprites() once a display exists.
+ZOMBIE_SPRITES: List[pygame.Surface] = []
+PROJECTILE_SPRITES: List[pygame.Surface] = []
+# Tower bodies are indexed by Tower.kind; health bar backings are keyed by zombie radius.
+TOWER_SPRITES: List[pygame.Surface] = []
+HEALTH_BAR_BACKS = {}
+TOWER_SIZE = 26
+HEALTH_BAR_HEIGHT = 5
+
+
+def build_sprites():
+    """Pre-render every zombie, tower and projectile so drawing is just blitting."""
+    ZOMBIE_SPRITES.clear()
+    HEALTH_BAR_BACKS.clear()
+    for name in ZOMBIE_TYPE_NAMES:
+        stats = ZOMBIE_TYPES[name]
+        outer = stats["radius"] + 3
+        sprite = pygame.Surface((outer * 2, outer * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, DARKER, (outer, outer), outer)
+        pygame.draw.circle(sprite, stats["color"], (outer, outer), stats["radius"])
+        ZOMBIE_SPRITES.append(sprite.convert_alpha())
+        if stats["radius"] not in HEALTH_BAR_BACKS:
+            back = pygame.Surface((stats["radius"] * 2, HEALTH_BAR_HEIGHT)).convert()
+            back.fill(DARKER)
+            HEALTH_BAR_BACKS[stats["radius"]] = back
+    TOWER_SPRITES.clear()
+    outer = TOWER_SIZE + 6
+    for tower_type in TOWER_TYPES:
+        sprite = pygame.Surface((outer, outer), pygame.SRCALPHA)
+        pygame.draw.rect(sprite, DARKER, (0, 0, outer, outer), border_radius=6)
+        pygame.draw.rect(sprite, tower_type.color, (3, 3, TOWER_SIZE, TOWER_SIZE), border_radius=6)
+        TOWER_SPRITES.append(sprite.convert_alpha())
+    PROJECTILE_SPRITES.clear()
+    for tower_type in TOWER_TYPES:
+        sprite = pygame.Surface((PROJECTILE_RADIUS * 2, PROJECTILE_RADIUS * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, tower_type.bullet_color, (PROJECTILE_RADIUS, PROJECTILE_RADIUS),
+                           PROJECTILE_RADIUS)
+        PROJECTILE_SPRITES.append(sprite.convert_alpha())
 
 
 # ----------------------------
 # Core Entities
 # ----------------------------
 
-class Zombie:
-    def __init__(self, path: List[Tuple[int, int]], zombie_type: str):
-        self.path = path
-        self.type = zombie_type
+class ZombieSwarm:
+    """Structure-of-arrays storage for every zombie on the field.
+
+    Each attribute is a NumPy array indexed by zombie slot, so movement and
+    cleanup run as a handful of vectorized operations per frame instead of
+    one Python method call per zombie.
+    """
+
+    def __init__(self, path: List[Tuple[int, int]]):
+        self.path_xy = np.asarray(path, dtype=np.float32)
+        # The path is static, so segment geometry is computed once and zombies
+        # walk it by arc length instead of re-aiming at the next waypoint.
+        self.path_seg_start = self.path_xy[:-1]
+        seg = self.path_xy[1:] - self.path_seg_start
+        self.path_seg_len = np.linalg.norm(seg, axis=1).astype(np.float32)
+        self.path_seg_dir = seg / self.path_seg_len[:, None]
+        self.pos = np.empty((0, 2), dtype=np.float32)
+        self.prev_pos = np.empty((0, 2), dtype=np.float32)
+        self.speed = np.empty(0, dtype=np.float32)
+        self.health = np.empty(0, dtype=np.float32)
+        self.max_health = np.empty(0, dtype=np.float32)
+        self.reward = np.empty(0, dtype=np.int32)
+        self.radius = np.empty(0, dtype=np.int32)
+        self.path_index = np.empty(0, dtype=np.int32)
+        self.path_s = np.empty(0, dtype=np.float32)
+        self.slow_timer = np.empty(0, dtype=np.float32)
+        self.slow_factor = np.empty(0, dtype=np.float32)
+        self.type_id = np.empty(0, dtype=np.int8)
+        self.alive = np.empty(0, dtype=bool)
+        self._grid = None
+        self._grid_xy: List[List[float]] = []
+
+    def __len__(self) -> int:
+        return len(self.alive)
+
+    def spawn(self, zombie_type: str):
         stats = ZOMBIE_TYPES[zombie_type]
-        self.max_health = stats["health"]
-        self.health = float(self.max_health)
-        self.speed = stats["speed"]
-        self.reward = stats["reward"]
-        self.color = stats["color"]
-        self.radius = 16 if zombie_type != "boss" else 24
-        self.path_index = 0
-        self.position = pygame.Vector2(self.path[0])
-        self.slow_timer = 0.0
-        self.slow_factor = 1.0
-
-    def update(self, dt: float) -> bool:
-        if self.slow_timer > 0:
-            self.slow_timer -= dt
-        else:
-            self.slow_factor = 1.0
-        if self.path_index >= len(self.path) - 1:
-            return True
-        target = pygame.Vector2(self.path[self.path_index + 1])
-        direction = (target - self.position)
-        dist = direction.length()
-        if dist == 0:
-            self.path_index += 1
-            return False
-        direction = direction.normalize()
-        move = self.speed * self.slow_factor * dt
-        if move >= dist:
-            self.position = target
-            self.path_index += 1
-        else:
-            self.position += direction * move
-        return False
-
-    def draw(self, surface: pygame.Surface):
-        pygame.draw.circle(surface, DARKER, self.position, self.radius + 3)
-        pygame.draw.circle(surface, self.color, self.position, self.radius)
-        bar_width = self.radius * 2
-        bar_height = 5
-        health_ratio = self.health / self.max_health
-        bar_x = self.position.x - self.radius
-        bar_y = self.position.y - self.radius - 10
-        pygame.draw.rect(surface, DARKER, (bar_x, bar_y, bar_width, bar_height))
-        pygame.draw.rect(surface, GREEN, (bar_x, bar_y, bar_width * health_ratio, bar_height))
-
-
-class Projectile:
-    def __init__(self, position: pygame.Vector2, target: Zombie, speed: float, damage: int,
-                 color: Tuple[int, int, int], splash_radius: int = 0, slow: float = 0.0,
-                 slow_duration: float = 0.0):
-        self.position = pygame.Vector2(position)
-        self.target = target
-        self.speed = speed
-        self.damage = damage
-        self.color = color
-        self.splash_radius = splash_radius
-        self.slow = slow
-        self.slow_duration = slow_duration
-        self.alive = True
-
-    def update(self, dt: float):
-        if not self.target or self.target.health <= 0:
-            self.alive = False
-            return
-        direction = (self.target.position - self.position)
-        dist = direction.length()
-        if dist == 0:
-            self.alive = False
-            return
-        direction = direction.normalize()
-        move = self.speed * dt
-        if move >= dist:
-            self.position = pygame.Vector2(self.target.position)
-            self.alive = False
-        else:
-            self.position += direction * move
+        self.pos = np.concatenate((self.pos, self.path_xy[:1]))
+        self.prev_pos = np.concatenate((self.prev_pos, self.path_xy[:1]))
+        self.speed = np.append(self.speed, np.float32(stats["speed"]))
+        self.health = np.append(self.health, np.float32(stats["health"]))
+        self.max_health = np.append(self.max_health, np.float32(stats["health"]))
+        self.reward = np.append(self.reward, np.int32(stats["reward"]))
+        self.radius = np.append(self.radius, np.int32(stats["radius"]))
+        self.path_index = np.append(self.path_index, np.int32(0))
+        self.path_s = np.append(self.path_s, np.float32(0.0))
+        self.slow_timer = np.append(self.slow_timer, np.float32(0.0))
+        self.slow_factor = np.append(self.slow_factor, np.float32(1.0))
+        self.type_id = np.append(self.type_id, np.int8(ZOMBIE_TYPE_NAMES.index(zombie_type)))
+        self.alive = np.append(self.alive, True)
+        self._grid = None
+
+    def update(self, dt: float) -> int:
+        """Advance every zombie along the path; return how many reached the end."""
+        if not len(self):
+            return 0
+        self._grid = None
+        np.copyto(self.prev_pos, self.pos)
+        if HAVE_NUMBA:
+            return advance_swarm(self.pos, self.speed, self.slow_timer, self.slow_factor,
+                                 self.path_index, self.path_s, self.alive,
+                                 self.path_seg_start, self.path_seg_dir, self.path_seg_len, dt)
+        slowed = self.slow_timer > 0
+        np.subtract(self.slow_timer, dt, out=self.slow_timer, where=slowed)
+        self.slow_factor[~slowed] = 1.0
+
+        last = len(self.path_seg_len)
+        self.path_s += self.speed * self.slow_factor * dt
+        # Segments are far longer than one tick's move, so this rarely loops twice.
+        while True:
+            crossed = (self.path_index < last) & (
+                self.path_s >= self.path_seg_len[np.minimum(self.path_index, last - 1)])
+            if not crossed.any():
+                break
+            self.path_s[crossed] -= self.path_seg_len[self.path_index[crossed]]
+            self.path_index += crossed
+
+        at_end = self.path_index >= last
+        self.path_index[at_end] = last - 1
+        self.path_s[at_end] = self.path_seg_len[last - 1]
+        escaped = self.alive & at_end
+        self.alive &= ~at_end
+        seg = self.path_index
+        np.multiply(self.path_seg_dir[seg], self.path_s[:, None], out=self.pos)
+        self.pos += self.path_seg_start[seg]
+        return int(np.count_nonzero(escaped))
+
+    def compact(self) -> Optional[np.ndarray]:
+        """Drop dead and escaped zombies; return the old-to-new slot mapping.
+
+        Slots that were removed map to -1, so callers holding zombie indices
+        (projectile targets) can remap them in one lookup. Returns None when
+        nothing was removed, which is the common case, so no mapping is built.
+        """
+        keep = self.alive & (self.health > 0)
+        if keep.all():
+            return None
+        self._grid = None
+        remap = np.full(len(self), -1, dtype=np.int32)
+        remap[keep] = np.arange(np.count_nonzero(keep), dtype=np.int32)
+        for name in ("speed", "health", "max_health", "reward", "radius", "path_index", "path_s",
+                     "slow_timer", "slow_factor", "type_id", "alive"):
+            setattr(self, name, np.compress(keep, getattr(self, name)))
+        self.pos = np.compress(keep, self.pos, axis=0)
+        self.prev_pos = np.compress(keep, self.prev_pos, axis=0)
+        return remap
+
+    def _build_grid(self):
+        grid = defaultdict(list)
+        self._grid_xy = self.pos.tolist()
+        for idx, (x, y) in enumerate(self._grid_xy):
+            grid[(int(x // GRID_SIZE), int(y // GRID_SIZE))].append(idx)
+        self._grid = grid
+
+    def query_radius(self, x: float, y: float, radius: float) -> List[int]:
+        """Return live zombie slots within ``radius`` of (x, y).
+
+        Uses a GRID_SIZE spatial hash built lazily from the current
+        positions, so only the cells overlapping the radius are scanned.
+        """
+        if self._grid is None:
+            self._build_grid()
+        reach = math.ceil(radius / GRID_SIZE)
+        cx, cy = int(x // GRID_SIZE), int(y // GRID_SIZE)
+        radius2 = radius * radius
+        alive = self.alive
+        hits = []
+        for gx in range(cx - reach, cx + reach + 1):
+            for gy in range(cy - reach, cy + reach + 1):
+                for idx in self._grid.get((gx, gy), ()):
+                    zx, zy = self._grid_xy[idx]
+                    if alive[idx] and (zx - x) ** 2 + (zy - y) ** 2 <= radius2:
+                        hits.append(idx)
+        return hits
+
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0):
+        positions = (self.prev_pos + (self.pos - self.prev_pos) * alpha).tolist()
+        radii = self.radius.tolist()
+        surface.blits(
+            [(ZOMBIE_SPRITES[type_id], (x - radius - 3, y - radius - 3))
+             for (x, y), radius, type_id in zip(positions, radii, self.type_id.tolist())],
+            doreturn=False,
+        )
+        for (x, y), radius, health_ratio in zip(positions, radii, (self.health / self.max_health).tolist()):
+            bar_x = x - radius
+            bar_y = y - radius - 10
+            surface.blit(HEALTH_BAR_BACKS[radius], (bar_x, bar_y))
+            pygame.draw.rect(surface, GREEN, (bar_x, bar_y, radius * 2 * health_ratio, HEALTH_BAR_HEIGHT))
+
 
-    def draw(self, surface: pygame.Surface):
-        pygame.draw.circle(surface, self.color, self.position, 4)
+class ProjectilePool:
+    """Structure-of-arrays storage for every projectile in flight.
+
+    Projectiles are far faster than zombies, so instead of homing step by
+    step the flight time is computed once from the firing distance and the
+    drawn position is interpolated between the muzzle and the target.
+    ``kind`` indexes TOWER_TYPES, which supplies bullet color, splash and
+    slow at impact time.
+    """
+
+    def __init__(self):
+        self.origin = np.empty((0, 2), dtype=np.float32)
+        self.pos = np.empty((0, 2), dtype=np.float32)
+        self.prev_pos = np.empty((0, 2), dtype=np.float32)
+        self.target = np.empty(0, dtype=np.int32)
+        self.flight_time = np.empty(0, dtype=np.float32)
+        self.elapsed = np.empty(0, dtype=np.float32)
+        self.damage = np.empty(0, dtype=np.float32)
+        self.kind = np.empty(0, dtype=np.int8)
+        self.alive = np.empty(0, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.alive)
+
+    def fire(self, origin: np.ndarray, target: np.ndarray, flight_time: np.ndarray, damage: np.ndarray,
+             kind: np.ndarray):
+        """Launch one projectile per row of ``origin``; the other arguments are parallel."""
+        muzzle = np.asarray(origin, dtype=np.float32).reshape(-1, 2)
+        count = len(muzzle)
+        self.origin = np.concatenate((self.origin, muzzle))
+        self.pos = np.concatenate((self.pos, muzzle))
+        self.prev_pos = np.concatenate((self.prev_pos, muzzle))
+        self.target = np.concatenate((self.target, np.asarray(target, dtype=np.int32)))
+        self.flight_time = np.concatenate((self.flight_time, np.asarray(flight_time, dtype=np.float32)))
+        self.elapsed = np.concatenate((self.elapsed, np.zeros(count, dtype=np.float32)))
+        self.damage = np.concatenate((self.damage, np.asarray(damage, dtype=np.float32)))
+        self.kind = np.concatenate((self.kind, np.asarray(kind, dtype=np.int8)))
+        self.alive = np.concatenate((self.alive, np.ones(count, dtype=bool)))
+
+    def update(self, dt: float, zombies: ZombieSwarm) -> np.ndarray:
+        """Advance every projectile; return the slots that reached their target.
+
+        Projectiles whose target is gone are marked dead without landing.
+        Landed and dead slots are dropped by the next compact().
+        """
+        if not len(self):
+            return np.empty(0, dtype=np.intp)
+        np.copyto(self.prev_pos, self.pos)
+        if not len(zombies):
+            self.alive[:] = False
+            return np.empty(0, dtype=np.intp)
+        target = np.maximum(self.target, 0)
+        live = (self.target >= 0) & zombies.alive[target] & (zombies.health[target] > 0)
+        self.elapsed += dt
+        progress = np.divide(self.elapsed, self.flight_time, out=np.ones_like(self.elapsed),
+                             where=self.flight_time > 0)
+        np.minimum(progress, 1.0, out=progress)
+        tracked = self.origin + (zombies.pos[target] - self.origin) * progress[:, None]
+        self.pos[live] = tracked[live]
+        landed = live & (self.elapsed >= self.flight_time)
+        self.alive = live & ~landed
+        return np.flatnonzero(landed)
+
+    def remap_targets(self, remap: np.ndarray):
+        """Follow a ZombieSwarm.compact() mapping; removed zombies become -1."""
+        if len(self):
+            self.target = np.where(self.target >= 0, remap[np.maximum(self.target, 0)], -1).astype(np.int32)
+
+    def compact(self):
+        if self.alive.all():
+            return
+        keep = self.alive
+        for name in ("target", "flight_time", "elapsed", "damage", "kind", "alive"):
+            setattr(self, name, np.compress(keep, getattr(self, name)))
+        for name in ("origin", "pos", "prev_pos"):
+            setattr(self, name, np.compress(keep, getattr(self, name), axis=0))
+
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0):
+        positions = (self.prev_pos + (self.pos - self.prev_pos) * alpha - PROJECTILE_RADIUS).tolist()
+        surface.blits(
+            [(PROJECTILE_SPRITES[kind], topleft) for kind, topleft in zip(self.kind.tolist(), positions)],
+            doreturn=False,
+        )
 
 
 class Tower:
+    """A placed tower's type, level and stats, used by the UI and drawing.
+
+    The per-tick state (cooldowns) and the fields targeting reads live in
+    parallel arrays on Game, rebuilt by Game.pack_towers() on placement and
+    upgrade.
+    """
+
+    __slots__ = ("tower_type", "kind", "x", "y", "level", "range2", "cooldown_period",
+                 "_dmg", "_rate", "_rng")
+
     def __init__(self, tower_type: TowerType, position: Tuple[int, int]):
         self.tower_type = tower_type
-        self.position = pygame.Vector2(position)
-        self.cooldown = 0.0
+        self.kind = TOWER_TYPES.index(tower_type)
+        self.x, self.y = position
         self.level = 1
-        self.pulse = 0.0
+        self._recompute_stats()
 
     def upgrade_cost(self) -> int:
         return int(self.tower_type.cost * (0.75 + 0.5 * self.level))
 
     def upgrade(self):
         self.level += 1
+        self._recompute_stats()
+
+    def _recompute_stats(self):
+        # Stats only change on upgrade, so Game.pack_towers() reads these.
+        self._dmg = self.tower_type.damage + (self.level - 1) * 6
+        self._rate = self.tower_type.fire_rate + (self.level - 1) * 0.2
+        self._rng = self.tower_type.range + (self.level - 1) * 10
+        self.cooldown_period = 1.0 / self._rate
+        self.range2 = self._rng ** 2
 
     def stats(self):
-        dmg = self.tower_type.damage + (self.level - 1) * 6
-        rate = self.tower_type.fire_rate + (self.level - 1) * 0.2
-        rng = self.tower_type.range + (self.level - 1) * 10
-        return dmg, rate, rng
-
-    def update(self, dt: float, zombies: List[Zombie], projectiles: List[Projectile]):
-        self.cooldown = max(0.0, self.cooldown - dt)
-        self.pulse = (self.pulse + dt) % 1.5
-        dmg, rate, rng = self.stats()
-        target = None
-        best_dist = float("inf")
-        for zombie in zombies:
-            dist = zombie.position.distance_to(self.position)
-            if dist <= rng and dist < best_dist:
-                best_dist = dist
-                target = zombie
-        if target and self.cooldown <= 0:
-            self.cooldown = 1.0 / rate
-            projectiles.append(
-                Projectile(
-                    self.position,
-                    target,
-                    speed=320,
-                    damage=dmg,
-                    color=self.tower_type.bullet_color,
-                    splash_radius=self.tower_type.splash_radius,
-                    slow=self.tower_type.slow,
-                    slow_duration=self.tower_type.slow_duration,
-                )
-            )
+        return self._dmg, self._rate, self._rng
 
     def draw(self, surface: pygame.Surface, selected=False):
-        size = 26
-        rect = pygame.Rect(0, 0, size, size)
-        rect.center = self.position
-        pygame.draw.rect(surface, DARKER, rect.inflate(6, 6), border_radius=6)
-        pygame.draw.rect(surface, self.tower_type.color, rect, border_radius=6)
+        sprite = TOWER_SPRITES[self.kind]
+        surface.blit(sprite, sprite.get_rect(center=(self.x, self.y)))
         if selected:
-            pygame.draw.circle(surface, SOFT_WHITE, self.position, self.tower_type.range, 1)
+            blit_range_circle(surface, (self.x, self.y), self.tower_type.range, SOFT_WHITE)
 
 
 # ----------------------------
@@ -265,18 +669,21 @@ class Tower:
 # ----------------------------
 
 class Button:
+    __slots__ = ("rect", "text", "font", "bg", "hover_bg", "fg", "hover")
+
     def __init__(self, rect: pygame.Rect, text: str, font, bg=BLUE, fg=WHITE):
         self.rect = rect
         self.text = text
         self.font = font
         self.bg = bg
+        self.hover_bg = tuple(min(255, c + 20) for c in bg)
         self.fg = fg
         self.hover = False
 
     def draw(self, surface):
-        color = tuple(min(255, c + 20) for c in self.bg) if self.hover else self.bg
+        color = self.hover_bg if self.hover else self.bg
         pygame.draw.rect(surface, color, self.rect, border_radius=8)
-        label = self.font.render(self.text, True, self.fg)
+        label = render_text(self.font, self.text, self.fg)
         label_rect = label.get_rect(center=self.rect.center)
         surface.blit(label, label_rect)
 
@@ -292,15 +699,37 @@ class Button:
 # ----------------------------
 
 class Game:
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         pygame.init()
         pygame.display.set_caption(TITLE)
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        # Only queue the events we handle. Hover state is polled via mouse.get_pos, so
+        # a flood of MOUSEMOTION events would just be drained and ignored. This blocks
+        # every other type too, including window events, so the expose events the
+        # renderer needs to repaint an uncovered window are allowed explicitly.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+                                  pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE])
+        build_sprites()
+        # Translucent overlays are filled once here rather than allocated per frame.
+        self._screen_shade = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        self._screen_shade.fill((0, 0, 0, 160))
+        self._card_shade = pygame.Surface(TOWER_CARD_RECTS[0].size, pygame.SRCALPHA)
+        self._card_shade.fill((0, 0, 0, 140))
+        self._preview_surfs = {}
+        for color in [tower_type.color for tower_type in TOWER_TYPES] + [RED]:
+            preview = pygame.Surface((TOWER_SIZE, TOWER_SIZE), pygame.SRCALPHA)
+            preview.fill((*color, 140))
+            self._preview_surfs[color] = preview
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont("arial", 20)
         self.big_font = pygame.font.SysFont("arial", 36, bold=True)
         self.tiny_font = pygame.font.SysFont("arial", 16)
+        # HUD label -> (value, rendered surface); re-rendered only when the value changes.
+        self._label_cache = {}
         self.running = True
+        # One generator for all gameplay randomness; pass a seed for reproducible runs.
+        self.rng = np.random.default_rng(seed)
 
         self.state = "menu"
         self.high_score = load_high_score()
@@ -315,8 +744,15 @@ class Game:
             (980, 260), (WIDTH, 260),
         ]
         self.towers: List[Tower] = []
-        self.projectiles: List[Projectile] = []
-        self.zombies: List[Zombie] = []
+        # GRID_SIZE spatial hash of tower indices for placement and picking.
+        self.tower_grid = defaultdict(list)
+        self.tower_cooldown = np.zeros(0)
+        self.pack_towers()
+        self.projectiles = ProjectilePool()
+        self.zombies = ZombieSwarm(self.path)
+        self.path_xy = np.asarray(self.path, dtype=np.float32)
+        self.path_sdf = self.build_path_sdf()
+        self.background = self.build_background()
         self.selected_tower: Optional[int] = None
         self.coins = 180
         self.lives = 20
@@ -324,160 +760,185 @@ class Game:
         self.wave = 0
         self.wave_in_progress = False
         self.spawn_timer = 0.0
-        self.spawn_queue: List[Tuple[str, float]] = []
+        self.spawn_queue = np.empty(0, dtype=np.int8)
+        self.spawn_head = 0
         self.pause = False
+        self.sim_accumulator = 0.0
 
-    def make_wave(self, wave_number: int) -> List[Tuple[str, float]]:
-        queue = []
-        base_count = 6 + wave_number * 2
-        for _ in range(base_count):
-            queue.append(("walker", 0.8))
+    def make_wave(self, wave_number: int) -> np.ndarray:
+        """Return the wave's spawn order as shuffled ZOMBIE_TYPE_NAMES indices."""
+        counts = np.zeros(len(ZOMBIE_TYPE_NAMES), dtype=np.intp)
+        counts[WALKER] = 6 + wave_number * 2
         if wave_number >= 2:
-            for _ in range(2 + wave_number // 2):
-                queue.append(("runner", 0.7))
+            counts[RUNNER] = 2 + wave_number // 2
         if wave_number >= 4:
-            for _ in range(1 + wave_number // 3):
-                queue.append(("brute", 1.4))
+            counts[BRUTE] = 1 + wave_number // 3
         if wave_number % 5 == 0:
-            queue.append(("boss", 2.2))
-        random.shuffle(queue)
-        return queue
+            counts[BOSS] = 1
+        queue = np.repeat(np.arange(len(ZOMBIE_TYPE_NAMES), dtype=np.int8), counts)
+        return self.rng.permutation(queue)
 
     def start_wave(self):
         self.wave += 1
         self.wave_in_progress = True
         self.spawn_queue = self.make_wave(self.wave)
+        self.spawn_head = 0
         self.spawn_timer = 1.0
 
     def handle_projectiles(self, dt: float):
-        for projectile in list(self.projectiles):
-            projectile.update(dt)
-            if not projectile.alive:
-                if projectile.target and projectile.target.health > 0:
-                    if projectile.splash_radius > 0:
-                        for zombie in self.zombies:
-                            if zombie.position.distance_to(projectile.position) <= projectile.splash_radius:
-                                zombie.health -= projectile.damage
-                    else:
-                        projectile.target.health -= projectile.damage
-                    if projectile.slow > 0 and projectile.target.health > 0:
-                        projectile.target.slow_factor = 1 - projectile.slow
-                        projectile.target.slow_timer = projectile.slow_duration
-                self.projectiles.remove(projectile)
+        if not self.projectiles:
+            return
+        zombies = self.zombies
+        projectiles = self.projectiles
+        landed = projectiles.update(dt, zombies)
+        # Impacts are few per tick and resolve in firing order, so a shot whose
+        # target was killed by an earlier impact this tick fizzles as before.
+        for slot in landed.tolist():
+            target = int(projectiles.target[slot])
+            if not (zombies.alive[target] and zombies.health[target] > 0):
+                continue
+            tower_type = TOWER_TYPES[projectiles.kind[slot]]
+            damage = projectiles.damage[slot]
+            if tower_type.splash_radius > 0:
+                x, y = projectiles.pos[slot].tolist()
+                zombies.health[zombies.query_radius(x, y, tower_type.splash_radius)] -= damage
+            else:
+                zombies.health[target] -= damage
+            if tower_type.slow > 0 and zombies.health[target] > 0:
+                zombies.slow_factor[target] = 1 - tower_type.slow
+                zombies.slow_timer[target] = tower_type.slow_duration
+        projectiles.compact()
 
     def remove_dead_zombies(self):
-        for zombie in list(self.zombies):
-            if zombie.health <= 0:
-                self.zombies.remove(zombie)
-                self.coins += zombie.reward
-                self.score += 20 + self.wave * 5
+        if not self.zombies:
+            return
+        zombies = self.zombies
+        killed = zombies.alive & (zombies.health <= 0)
+        kills = int(np.count_nonzero(killed))
+        if kills:
+            self.coins += int(zombies.reward[killed].sum())
+            self.score += kills * (20 + self.wave * 5)
+        remap = zombies.compact()
+        if remap is not None:
+            self.projectiles.remap_targets(remap)
 
     def update_game(self, dt: float):
         if self.pause:
             return
-        if not self.wave_in_progress and not self.zombies:
-            pass
         if self.wave_in_progress:
             self.spawn_timer -= dt
-            if self.spawn_timer <= 0 and self.spawn_queue:
-                zombie_type, delay = self.spawn_queue.pop()
-                self.zombies.append(Zombie(self.path, zombie_type))
-                self.spawn_timer = delay
-            if not self.spawn_queue and not self.zombies:
+            pending = self.spawn_head < len(self.spawn_queue)
+            if self.spawn_timer <= 0 and pending:
+                zombie_type = ZOMBIE_TYPE_NAMES[self.spawn_queue[self.spawn_head]]
+                self.spawn_head += 1
+                self.zombies.spawn(zombie_type)
+                self.spawn_timer = ZOMBIE_TYPES[zombie_type]["spawn_delay"]
+                pending = self.spawn_head < len(self.spawn_queue)
+            if not pending and not self.zombies:
                 self.wave_in_progress = False
                 self.coins += 30 + self.wave * 5
 
-        for zombie in list(self.zombies):
-            reached_end = zombie.update(dt)
-            if reached_end:
-                self.zombies.remove(zombie)
-                self.lives -= 1
-                if self.lives <= 0:
-                    self.state = "gameover"
-                    self.high_score = max(self.high_score, self.score)
-                    save_high_score(self.high_score)
+        escaped = self.zombies.update(dt)
+        if escaped:
+            self.lives -= escaped
+            if self.lives <= 0:
+                self.state = "gameover"
+                self.high_score = max(self.high_score, self.score)
+                save_high_score(self.high_score)
 
         self.handle_projectiles(dt)
         self.remove_dead_zombies()
 
-        for tower in self.towers:
-            tower.update(dt, self.zombies, self.projectiles)
+        cooldown = self.tower_cooldown
+        cooldown -= dt
+        np.maximum(cooldown, 0.0, out=cooldown)
+        # Only towers off cooldown can shoot this tick, so only they need a target.
+        ready = np.flatnonzero(cooldown <= 0)
+        if len(ready) and self.zombies:
+            zombies = self.zombies
+            targets = find_targets(self.tower_xy[ready], self.tower_range2[ready], zombies.pos, zombies.alive)
+            has_target = targets >= 0
+            fired = ready[has_target]
+            if len(fired):
+                targets = targets[has_target]
+                cooldown[fired] = self.tower_period[fired]
+                origin = self.tower_xy[fired]
+                offset = zombies.pos[targets] - origin
+                dist = np.hypot(offset[:, 0], offset[:, 1])
+                self.projectiles.fire(origin, targets, dist / PROJECTILE_SPEED, self.tower_damage[fired],
+                                      self.tower_kind[fired])
+
+    def pack_towers(self):
+        """Rebuild the per-tower arrays read each tick; existing cooldowns carry over."""
+        towers = self.towers
+        cooldown = np.zeros(len(towers))
+        cooldown[:len(self.tower_cooldown)] = self.tower_cooldown
+        self.tower_cooldown = cooldown
+        self.tower_xy = np.array([(tower.x, tower.y) for tower in towers], dtype=np.float32).reshape(-1, 2)
+        self.tower_range2 = np.array([tower.range2 for tower in towers], dtype=np.float32)
+        self.tower_period = np.array([tower.cooldown_period for tower in towers])
+        self.tower_damage = np.array([tower.stats()[0] for tower in towers], dtype=np.float32)
+        self.tower_kind = np.array([tower.kind for tower in towers], dtype=np.int8)
 
     # ----------------------------
     # Rendering
     # ----------------------------
 
-    def draw_path(self):
-        pygame.draw.lines(self.screen, (60, 80, 60), False, self.path, 40)
-        pygame.draw.lines(self.screen, (40, 60, 40), False, self.path, 6)
+    def build_background(self) -> pygame.Surface:
+        """Pre-render the static playfield and UI strip so each frame starts with one blit."""
+        background = pygame.Surface((WIDTH, HEIGHT)).convert()
+        background.fill(DARK)
+        self.draw_path(background)
+        self.draw_grid(background)
+        pygame.draw.rect(background, DARKER, UI_RECT)
+        return background
 
-    def draw_grid(self):
+    def draw_path(self, surface: pygame.Surface):
+        pygame.draw.lines(surface, (60, 80, 60), False, self.path, 40)
+        pygame.draw.lines(surface, (40, 60, 40), False, self.path, 6)
+
+    def draw_grid(self, surface: pygame.Surface):
         for x in range(0, WIDTH, GRID_SIZE):
-            pygame.draw.line(self.screen, (30, 35, 40), (x, 0), (x, PLAY_AREA.bottom))
+            pygame.draw.line(surface, (30, 35, 40), (x, 0), (x, PLAY_AREA.bottom))
         for y in range(0, PLAY_AREA.bottom, GRID_SIZE):
-            pygame.draw.line(self.screen, (30, 35, 40), (0, y), (WIDTH, y))
+            pygame.draw.line(surface, (30, 35, 40), (0, y), (WIDTH, y))
 
     def draw_ui(self):
-        ui_rect = pygame.Rect(0, PLAY_AREA.bottom, WIDTH, UI_HEIGHT)
-        pygame.draw.rect(self.screen, DARKER, ui_rect)
-
-        labels = [
-            f"Lives: {self.lives}",
-            f"Coins: {self.coins}",
-            f"Score: {self.score}",
-            f"Wave: {self.wave}",
-        ]
-        for idx, text in enumerate(labels):
-            label = self.font.render(text, True, WHITE)
-            self.screen.blit(label, (20 + idx * 180, PLAY_AREA.bottom + 10))
+        labels = (("Lives", self.lives), ("Coins", self.coins), ("Score", self.score), ("Wave", self.wave))
+        for idx, (name, value) in enumerate(labels):
+            cached = self._label_cache.get(name)
+            if cached is None or cached[0] != value:
+                cached = self._label_cache[name] = (value, self.font.render(f"{name}: {value}", True, WHITE))
+            self.screen.blit(cached[1], (20 + idx * 180, PLAY_AREA.bottom + 10))
 
         wave_text = "In Progress" if self.wave_in_progress else "Ready"
-        status = self.tiny_font.render(f"Wave: {wave_text}", True, SOFT_WHITE)
+        status = render_text(self.tiny_font, f"Wave: {wave_text}", SOFT_WHITE)
         self.screen.blit(status, (20, PLAY_AREA.bottom + 40))
-<<<<<<< HEAD
         if not self.wave_in_progress:
-            prompt = self.tiny_font.render("Press SPACE to start next wave", True, SOFT_WHITE)
+            prompt = render_text(self.tiny_font, "Press SPACE to start next wave", SOFT_WHITE)
             self.screen.blit(prompt, (20, PLAY_AREA.bottom + 60))
-=======
->>>>>>> main
 
-        for i, tower_type in enumerate(TOWER_TYPES):
-            x = 420 + i * 160
-            rect = pygame.Rect(x, PLAY_AREA.bottom + 10, 140, 70)
+        for tower_type, rect in zip(TOWER_TYPES, TOWER_CARD_RECTS):
             pygame.draw.rect(self.screen, tower_type.color, rect, border_radius=8)
-            name = self.tiny_font.render(tower_type.name, True, DARKER)
-            cost = self.tiny_font.render(f"${tower_type.cost}", True, DARKER)
-            self.screen.blit(name, (x + 8, PLAY_AREA.bottom + 14))
-            self.screen.blit(cost, (x + 8, PLAY_AREA.bottom + 38))
+            name = render_text(self.tiny_font, tower_type.name, DARKER)
+            cost = render_text(self.tiny_font, f"${tower_type.cost}", DARKER)
+            self.screen.blit(name, (rect.x + 8, rect.y + 4))
+            self.screen.blit(cost, (rect.x + 8, rect.y + 28))
             if self.coins < tower_type.cost:
-<<<<<<< HEAD
-                overlay = pygame.Surface(rect.size, pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, 140))
-                self.screen.blit(overlay, rect.topleft)
-=======
-                pygame.draw.rect(self.screen, (0, 0, 0, 120), rect)
->>>>>>> main
-
-    def draw_game(self):
-        self.screen.fill(DARK)
-        self.draw_path()
-        self.draw_grid()
+                self.screen.blit(self._card_shade, rect.topleft)
+
+    def draw_game(self, alpha: float = 1.0):
+        self.screen.blit(self.background, (0, 0))
         for tower in self.towers:
             selected = self.selected_tower is not None and self.towers[self.selected_tower] == tower
             tower.draw(self.screen, selected)
-        for zombie in self.zombies:
-            zombie.draw(self.screen)
-        for projectile in self.projectiles:
-            projectile.draw(self.screen)
-<<<<<<< HEAD
+        self.zombies.draw(self.screen, alpha)
+        self.projectiles.draw(self.screen, alpha)
         self.draw_placement_preview()
-=======
->>>>>>> main
         self.draw_ui()
         if self.pause:
             self.draw_overlay("Paused", "Press P to resume")
 
-<<<<<<< HEAD
     def draw_placement_preview(self):
         if self.selected_tower is None:
             return
@@ -491,21 +952,15 @@ class Game:
         tower_type = TOWER_TYPES[self.selected_tower]
         can_place = self.can_place(snapped)
         color = tower_type.color if can_place else RED
-        preview_rect = pygame.Rect(0, 0, 26, 26)
+        preview_rect = pygame.Rect(0, 0, TOWER_SIZE, TOWER_SIZE)
         preview_rect.center = snapped
-        preview = pygame.Surface(preview_rect.size, pygame.SRCALPHA)
-        preview.fill((*color, 140))
-        self.screen.blit(preview, preview_rect.topleft)
-        pygame.draw.circle(self.screen, color, snapped, tower_type.range, 1)
+        self.screen.blit(self._preview_surfs[color], preview_rect.topleft)
+        blit_range_circle(self.screen, snapped, tower_type.range, color)
 
-=======
->>>>>>> main
     def draw_overlay(self, title: str, subtitle: str):
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 160))
-        self.screen.blit(overlay, (0, 0))
-        title_label = self.big_font.render(title, True, WHITE)
-        subtitle_label = self.font.render(subtitle, True, SOFT_WHITE)
+        self.screen.blit(self._screen_shade, (0, 0))
+        title_label = render_text(self.big_font, title, WHITE)
+        subtitle_label = render_text(self.font, subtitle, SOFT_WHITE)
         self.screen.blit(title_label, title_label.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 20)))
         self.screen.blit(subtitle_label, subtitle_label.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 20)))
 
@@ -517,32 +972,38 @@ class Game:
         rect = pygame.Rect(position[0] - 16, position[1] - 16, 32, 32)
         if not PLAY_AREA.contains(rect):
             return False
-        for tower in self.towers:
-            if tower.position.distance_to(position) < 36:
-                return False
-        # Avoid path
-        for i in range(len(self.path) - 1):
-            a = pygame.Vector2(self.path[i])
-            b = pygame.Vector2(self.path[i + 1])
-            if self.point_to_segment_distance(position, a, b) < 40:
+        if self.towers_near(position, 36):
+            return False
+        # Avoid path: the distance field settles almost every position, only
+        # points near the clearance edge fall back to exact segment tests.
+        dist = int(self.path_sdf[position[1] // PATH_SDF_CELL, position[0] // PATH_SDF_CELL])
+        if dist + PATH_SDF_SLACK <= PATH_CLEARANCE:
+            return False
+        if dist - PATH_SDF_SLACK < PATH_CLEARANCE:
+            if min_dist2_to_path(float(position[0]), float(position[1]), self.path_xy) < PATH_CLEARANCE ** 2:
                 return False
         return True
 
-    @staticmethod
-    def point_to_segment_distance(point, a, b):
-        ap = pygame.Vector2(point) - a
-        ab = b - a
-        ab_len2 = ab.length_squared()
-        if ab_len2 == 0:
-            return ap.length()
-        t = clamp(ap.dot(ab) / ab_len2, 0, 1)
-        closest = a + ab * t
-        return pygame.Vector2(point).distance_to(closest)
+    def build_path_sdf(self) -> np.ndarray:
+        """Return the distance from each PATH_SDF_CELL cell centre to the path.
+
+        Distances are clamped to 255 and stored as uint8, indexed [y, x].
+        """
+        rows = -(-PLAY_AREA.bottom // PATH_SDF_CELL)
+        cols = -(-WIDTH // PATH_SDF_CELL)
+        ys, xs = np.mgrid[0:rows, 0:cols].astype(np.float32) * PATH_SDF_CELL + PATH_SDF_CELL / 2
+        field = np.full((rows, cols), np.inf, dtype=np.float32)
+        for (ax, ay), (bx, by) in zip(self.path, self.path[1:]):
+            abx, aby = bx - ax, by - ay
+            ab_len2 = abx * abx + aby * aby
+            t = ((xs - ax) * abx + (ys - ay) * aby) / ab_len2 if ab_len2 else np.zeros_like(xs)
+            t = np.clip(t, 0.0, 1.0)
+            np.minimum(field, np.hypot(xs - (ax + abx * t), ys - (ay + aby * t)), out=field)
+        return np.minimum(field, 255).astype(np.uint8)
 
     def handle_game_click(self, pos: Tuple[int, int]):
         if pos[1] > PLAY_AREA.bottom:
-            for i, tower_type in enumerate(TOWER_TYPES):
-                rect = pygame.Rect(420 + i * 160, PLAY_AREA.bottom + 10, 140, 70)
+            for i, (tower_type, rect) in enumerate(zip(TOWER_TYPES, TOWER_CARD_RECTS)):
                 if rect.collidepoint(pos) and self.coins >= tower_type.cost:
                     self.selected_tower = i
             return
@@ -554,20 +1015,39 @@ class Game:
             )
             if self.can_place(snapped):
                 tower_type = TOWER_TYPES[self.selected_tower]
-<<<<<<< HEAD
                 if self.coins >= tower_type.cost:
-                    self.towers.append(Tower(tower_type, snapped))
+                    self.place_tower(tower_type, snapped)
                     self.coins -= tower_type.cost
-=======
-                self.towers.append(Tower(tower_type, snapped))
-                self.coins -= tower_type.cost
->>>>>>> main
             return
 
-        for idx, tower in enumerate(self.towers):
-            if tower.position.distance_to(pos) < 20:
-                self.selected_tower = idx
-                return
+        picked = self.towers_near(pos, 20)
+        if picked:
+            self.selected_tower = picked[0]
+
+    def place_tower(self, tower_type: TowerType, position: Tuple[int, int]):
+        self.tower_grid[(position[0] // GRID_SIZE, position[1] // GRID_SIZE)].append(len(self.towers))
+        self.towers.append(Tower(tower_type, position))
+        self.pack_towers()
+
+    def towers_near(self, position: Tuple[int, int], radius: int) -> List[int]:
+        """Return indices of towers strictly within ``radius`` of position, lowest first.
+
+        Only the tower_grid cells overlapping the radius are scanned.
+        """
+        px, py = position
+        reach = math.ceil(radius / GRID_SIZE)
+        cx, cy = px // GRID_SIZE, py // GRID_SIZE
+        towers = self.towers
+        hits = []
+        for gx in range(cx - reach, cx + reach + 1):
+            for gy in range(cy - reach, cy + reach + 1):
+                for idx in self.tower_grid.get((gx, gy), ()):
+                    dx = towers[idx].x - px
+                    dy = towers[idx].y - py
+                    if dx * dx + dy * dy < radius * radius:
+                        hits.append(idx)
+        hits.sort()
+        return hits
 
     def handle_key(self, event):
         if event.key == pygame.K_ESCAPE:
@@ -582,6 +1062,7 @@ class Game:
             if self.coins >= cost:
                 self.coins -= cost
                 tower.upgrade()
+                self.pack_towers()
 
     # ----------------------------
     # Menus
@@ -611,9 +1092,9 @@ class Game:
                 button.update(mouse_pos)
 
             self.screen.fill(DARK)
-            title = self.big_font.render(TITLE, True, WHITE)
-            subtitle = self.font.render("Survive the horde. Build smart. Win big.", True, SOFT_WHITE)
-            high = self.font.render(f"High Score: {self.high_score}", True, YELLOW)
+            title = render_text(self.big_font, TITLE, WHITE)
+            subtitle = render_text(self.font, "Survive the horde. Build smart. Win big.", SOFT_WHITE)
+            high = render_text(self.font, f"High Score: {self.high_score}", YELLOW)
             self.screen.blit(title, title.get_rect(center=(WIDTH // 2, 180)))
             self.screen.blit(subtitle, subtitle.get_rect(center=(WIDTH // 2, 220)))
             self.screen.blit(high, high.get_rect(center=(WIDTH // 2, 460)))
@@ -644,7 +1125,7 @@ class Game:
                 button.update(mouse_pos)
 
             self.screen.fill(DARK)
-            title = self.big_font.render("Settings", True, WHITE)
+            title = render_text(self.big_font, "Settings", WHITE)
             self.screen.blit(title, title.get_rect(center=(WIDTH // 2, 200)))
             for button in (difficulty_btn, back_btn):
                 button.draw(self.screen)
@@ -671,9 +1152,9 @@ class Game:
                 button.update(mouse_pos)
 
             self.screen.fill(DARK)
-            title = self.big_font.render("Game Over", True, RED)
-            score = self.font.render(f"Score: {self.score}", True, WHITE)
-            high = self.font.render(f"High Score: {self.high_score}", True, YELLOW)
+            title = render_text(self.big_font, "Game Over", RED)
+            score = render_text(self.font, f"Score: {self.score}", WHITE)
+            high = render_text(self.font, f"High Score: {self.high_score}", YELLOW)
             self.screen.blit(title, title.get_rect(center=(WIDTH // 2, 220)))
             self.screen.blit(score, score.get_rect(center=(WIDTH // 2, 270)))
             self.screen.blit(high, high.get_rect(center=(WIDTH // 2, 300)))
@@ -685,8 +1166,24 @@ class Game:
     # Main loop
     # ----------------------------
 
+    def static_frame_key(self):
+        """Return what the next frame depends on when nothing is animating, else None.
+
+        Paused, or idle between waves, the frame only changes with the HUD
+        values, the selection and (for the placement preview) the mouse.
+        """
+        if not (self.pause or (not self.wave_in_progress and not self.zombies and not len(self.projectiles))):
+            return None
+        mouse = pygame.mouse.get_pos() if self.selected_tower is not None else None
+        return (self.pause, self.selected_tower, mouse, self.coins, self.lives, self.score, self.wave,
+                len(self.towers))
+
     def run(self):
+        last_frame_key = None
         while self.running:
+            if self.state != "game":
+                # Menus draw over the screen, so the game frame must be redrawn on return.
+                last_frame_key = None
             if self.state == "menu":
                 self.run_menu()
                 continue
@@ -697,7 +1194,7 @@ class Game:
                 self.run_gameover()
                 continue
 
-            dt = self.clock.tick(FPS) / 1000
+            frame_time = min(self.clock.tick(FPS) / 1000, MAX_FRAME_TIME)
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self.running = False
@@ -705,10 +1202,22 @@ class Game:
                     self.handle_game_click(event.pos)
                 if event.type == pygame.KEYDOWN:
                     self.handle_key(event)
-
-            self.update_game(dt)
-            self.draw_game()
-            pygame.display.flip()
+                if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                    # The window contents were lost (e.g. uncovered on an uncomposited
+                    # desktop), so the next frame must repaint even if nothing changed.
+                    last_frame_key = None
+
+            # Fixed-timestep simulation: slow frames run extra ticks instead of
+            # slowing the game down, and rendering blends the last two ticks.
+            self.sim_accumulator += frame_time
+            while self.sim_accumulator >= SIM_DT and self.state == "game":
+                self.update_game(SIM_DT)
+                self.sim_accumulator -= SIM_DT
+            frame_key = self.static_frame_key()
+            if frame_key is None or frame_key != last_frame_key:
+                self.draw_game(1.0 if self.pause else self.sim_accumulator / SIM_DT)
+                pygame.display.flip()
+            last_frame_key = frame_key
 
         pygame.quit()
         sys.exit()